@@ -1,4 +1,5 @@
 from .json_repair import from_file as from_file
 from .json_repair import load as load
 from .json_repair import loads as loads
+from .json_repair import loads_many as loads_many
 from .json_repair import repair_json as repair_json
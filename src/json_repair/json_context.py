@@ -28,6 +28,19 @@ class JsonContext:
         self.current = value
         self.empty = False
 
+    def swap(self, value: ContextValues) -> None:
+        """
+        Replace the most recent context value, same as reset() followed by set() on a non empty context but without resizing the stack.
+
+        Args:
+            value (ContextValues): The context value that replaces the current one.
+
+        Returns:
+            None
+        """
+        self.context[-1] = value
+        self.current = value
+
     def reset(self) -> None:
         """
         Remove the most recent context value.
@@ -1,3 +1,5 @@
+import re
+import sys
 from typing import Any, Dict, List, Literal, Optional, TextIO, Tuple, Union
 
 from .json_context import ContextValues, JsonContext
@@ -5,10 +7,39 @@ from .string_file_wrapper import StringFileWrapper
 
 JSONReturnType = Union[Dict[str, Any], List[Any], str, float, int, bool, None]
 
+WHITESPACES_PATTERN = re.compile(r"\s*")
+WHITESPACES_AND_COMMAS_PATTERN = re.compile(r"[\s,]*")
+# Characters that can be part of a number (or a currency or a fraction), as sets and as patterns
+NUMBER_CHARS = frozenset("0123456789-.eE/,")
+ARRAY_NUMBER_CHARS = NUMBER_CHARS - {","}
+NUMBER_PATTERN = re.compile(r"[0-9\-.eE/,]*")
+ARRAY_NUMBER_PATTERN = re.compile(r"[0-9\-.eE/]*")
+# The literals parse_boolean_or_null accepts (in any case), by first character
+LITERALS: Dict[str, Tuple[str, Optional[bool]]] = {
+    "t": ("true", True),
+    "f": ("false", False),
+    "n": ("null", None),
+}
+# How parse_string normalizes stray escape sequences
+ESCAPE_SEQUENCES = {"t": "\t", "n": "\n", "r": "\r", "b": "\b"}
+# Compiled patterns used by parse_string to jump to the next character that needs attention, by character class
+STRING_STOP_PATTERNS: Dict[Tuple[str, bool], re.Pattern[str]] = {}
+
 
 class JSONParser:
     # Constants
     STRING_DELIMITERS = ['"', "'", "“", "”"]
+    STRING_DELIMITERS_AND_CONTAINERS = frozenset(STRING_DELIMITERS + ["{", "["])
+    # The attributes are read and written all the time while parsing, slots make that cheaper
+    __slots__ = (
+        "json_str",
+        "index",
+        "context",
+        "split_object",
+        "logging",
+        "logger",
+        "log",
+    )
 
     def __init__(
         self,
@@ -27,6 +58,9 @@ class JSONParser:
         self.index: int = 0
         # This is used in the object member parsing to manage the special cases of missing quotes in key or value
         self.context = JsonContext()
+        # Set when an object in an array was closed early because of a duplicate key,
+        # the members that follow are parsed as a new object
+        self.split_object: bool = False
         # Use this to log the activity, but only if logging is active
 
         # This is a trick but a beatiful one. We call self.log in the code over and over even if it's not needed.
@@ -51,7 +85,13 @@ class JSONParser:
             json = [json]
             last_index = self.index
             while self.index < len(self.json_str):
-                j = self.parse_json()
+                j: JSONReturnType
+                if self.split_object:
+                    # Same as in parse_array, an object was closed on a duplicate key and the next one starts here
+                    self.split_object = False
+                    j = self.parse_object()
+                else:
+                    j = self.parse_json()
                 if j != "":
                     json.append(j)
                 if self.index == last_index:
@@ -72,10 +112,15 @@ class JSONParser:
         self,
     ) -> JSONReturnType:
         while True:
-            char = self.get_char_at()
-            # False means that we are at the end of the string provided
-            if char is False:
+            # This runs once per value, so get_char_at() is open-coded here
+            try:
+                char = self.json_str[self.index]
+            except IndexError:
+                # We are at the end of the string provided
                 return ""
+            # A double quoted string is by far the most common value, don't make it wait behind the other checks
+            if char == '"' and not self.context.empty:
+                return self.parse_string()
             # <object> starts with '{'
             elif char == "{":
                 self.index += 1
@@ -86,7 +131,7 @@ class JSONParser:
                 return self.parse_array()
             # there can be an edge case in which a key is empty and at the end of an object
             # like "key": }. We return an empty string here to close the object properly
-            elif self.context.current == ContextValues.OBJECT_VALUE and char == "}":
+            elif char == "}" and self.context.current == ContextValues.OBJECT_VALUE:
                 self.log(
                     "At the end of an object we found a key with missing value, skipping",
                 )
@@ -100,16 +145,27 @@ class JSONParser:
             elif not self.context.empty and (
                 char.isdigit() or char == "-" or char == "."
             ):
+                # A stray "-" is thrown away by parse_number, skip it here so a long run of them
+                # doesn't recurse through parse_number -> parse_json for each one
+                if char == "-" and self.is_stray_minus():
+                    self.index += 1
+                    continue
                 return self.parse_number()
+            # Whitespaces usually come in runs (think indentation), skip the whole run at once
+            elif char.isspace():
+                self.skip_whitespaces_at()
             # If everything else fails, we just ignore and move on
             else:
                 self.index += 1
 
     def parse_object(self) -> Dict[str, JSONReturnType]:
         # <object> ::= '{' [ <member> *(', ' <member>) ] '}' ; A sequence of 'members'
-        obj = {}
+        obj: Dict[str, JSONReturnType] = {}
+        # Bound method lookups add up in the loops below, do it once
+        get_char_at = self.get_char_at
+        intern = sys.intern
         # Stop when you either find the closing parentheses or you have iterated over the entire string
-        while (self.get_char_at() or "}") != "}":
+        while (get_char_at() or "}") != "}":
             # This is what we expect to find:
             # <member> ::= <string> ': ' <json>
 
@@ -117,7 +173,7 @@ class JSONParser:
             self.skip_whitespaces_at()
 
             # Sometimes LLMs do weird things, if we find a ":" so early, we'll change it to "," and move on
-            if (self.get_char_at() or "") == ":":
+            if (get_char_at() or "") == ":":
                 self.log(
                     "While parsing an object we found a : before a key, ignoring",
                 )
@@ -134,53 +190,50 @@ class JSONParser:
 
             # <member> starts with a <string>
             key = ""
-            while self.get_char_at():
+            while get_char_at():
                 # The rollback index needs to be updated here in case the key is empty
                 rollback_index = self.index
                 key = str(self.parse_string())
 
-                if key != "" or (key == "" and self.get_char_at() == ":"):
+                if key != "" or (key == "" and get_char_at() == ":"):
                     # If the string is empty but there is a object divider, we are done here
                     break
             if ContextValues.ARRAY in self.context.context and key in obj:
                 self.log(
                     "While parsing an object we found a duplicate key, closing the object here and rolling back the index",
                 )
-                self.index = rollback_index - 1
-                # add an opening curly brace to make this work
-                self.json_str = (
-                    self.json_str[: self.index + 1]
-                    + "{"
-                    + self.json_str[self.index + 1 :]
-                )
-                break
+                # Instead of adding an opening curly brace to the string, flag that a new object starts at the duplicate key
+                self.index = rollback_index
+                self.split_object = True
+                return obj
 
             # Skip filler whitespaces
             self.skip_whitespaces_at()
 
             # We reached the end here
-            if (self.get_char_at() or "}") == "}":
+            if (get_char_at() or "}") == "}":
                 continue
 
-            self.skip_whitespaces_at()
-
             # An extreme case of missing ":" after a key
-            if (self.get_char_at() or "") != ":":
+            if (get_char_at() or "") != ":":
                 self.log(
                     "While parsing an object we missed a : after a key",
                 )
 
             self.index += 1
-            self.context.reset()
-            self.context.set(ContextValues.OBJECT_VALUE)
+            self.context.swap(ContextValues.OBJECT_VALUE)
             # The value can be any valid json
             value = self.parse_json()
 
             # Reset context since our job is done
             self.context.reset()
-            obj[key] = value
+            # Arrays of records repeat the same keys over and over, this way all the objects share one copy of each key
+            obj[intern(key)] = value
 
-            if (self.get_char_at() or "") in [",", "'", '"']:
+            if self.split_object:
+                # The value was split on a duplicate key, we are already at the next key
+                self.split_object = False
+            elif (get_char_at() or "") in {",", "'", '"'}:
                 self.index += 1
 
             # Remove trailing spaces
@@ -191,33 +244,41 @@ class JSONParser:
 
     def parse_array(self) -> List[JSONReturnType]:
         # <array> ::= '[' [ <json> *(', ' <json>) ] ']' ; A sequence of JSON values separated by commas
-        arr = []
+        arr: List[JSONReturnType] = []
+        get_char_at = self.get_char_at
         self.context.set(ContextValues.ARRAY)
         # Stop when you either find the closing parentheses or you have iterated over the entire string
-        char = self.get_char_at()
-        while char and char not in ["]", "}"]:
+        char = get_char_at()
+        while char and char not in {"]", "}"}:
             self.skip_whitespaces_at()
-            value = self.parse_json()
+            value: JSONReturnType
+            if self.split_object:
+                # The previous object was closed on a duplicate key, what follows is the next object
+                self.split_object = False
+                value = self.parse_object()
+            else:
+                value = self.parse_json()
 
             # It is possible that parse_json() returns nothing valid, so we stop
             if value == "":
                 break
 
-            if value == "..." and self.get_char_at(-1) == ".":
+            if value == "..." and get_char_at(-1) == ".":
                 self.log(
                     "While parsing an array, found a stray '...'; ignoring it",
                 )
             else:
                 arr.append(value)
 
-            # skip over whitespace after a value but before closing ]
-            char = self.get_char_at()
-            while char and (char.isspace() or char == ","):
-                self.index += 1
-                char = self.get_char_at()
+            if self.split_object:
+                continue
+
+            # skip over whitespace and commas after a value but before closing ], in one regex match
+            self.index = self.match_end(WHITESPACES_AND_COMMAS_PATTERN, self.index)
+            char = get_char_at()
 
         # Especially at the end of an LLM generated json you might miss the last "]"
-        char = self.get_char_at()
+        char = get_char_at()
         if char and char != "]":
             self.log(
                 "While parsing an array we missed the closing ], adding it back",
@@ -237,12 +298,14 @@ class JSONParser:
         missing_quotes = False
         doubled_quotes = False
         lstring_delimiter = rstring_delimiter = '"'
+        # This function calls get_char_at a lot, so avoid the attribute lookup every time
+        get_char_at = self.get_char_at
 
-        char = self.get_char_at()
+        char = get_char_at()
         # A valid string can only start with a valid quote or, in our case, with a literal
         while char and char not in self.STRING_DELIMITERS and not char.isalnum():
             self.index += 1
-            char = self.get_char_at()
+            char = get_char_at()
 
         if not char:
             # This is an empty string
@@ -258,7 +321,7 @@ class JSONParser:
             # This could be a <boolean> and not a string. Because (T)rue or (F)alse or (N)ull are valid
             # But remember, object keys are only of type string
             if (
-                char.lower() in ["t", "f", "n"]
+                char in {"t", "f", "n", "T", "F", "N"}
                 and self.context.current != ContextValues.OBJECT_KEY
             ):
                 value = self.parse_boolean_or_null()
@@ -277,17 +340,17 @@ class JSONParser:
 
         self.skip_whitespaces_at()
         # There is sometimes a weird case of doubled quotes, we manage this also later in the while loop
-        if self.get_char_at() in self.STRING_DELIMITERS:
+        if get_char_at() in self.STRING_DELIMITERS:
             # If the next character is the same type of quote, then we manage it as double quotes
-            if self.get_char_at() == lstring_delimiter:
+            if get_char_at() == lstring_delimiter:
                 # If it's an empty key, this was easy
                 if (
                     self.context.current == ContextValues.OBJECT_KEY
-                    and self.get_char_at(1) == ":"
+                    and get_char_at(1) == ":"
                 ):
                     self.index += 1
                     return ""
-                if self.get_char_at(1) == lstring_delimiter:
+                if get_char_at(1) == lstring_delimiter:
                     # There's something fishy about this, we found doubled quotes and then again quotes
                     self.log(
                         "While parsing a string, we found a doubled quote and then a quote again, ignoring it",
@@ -295,10 +358,10 @@ class JSONParser:
                     return ""
                 # Find the next delimiter
                 i = self.skip_to_character(character=rstring_delimiter, idx=1)
-                next_c = self.get_char_at(i)
+                next_c = get_char_at(i)
                 # Now check that the next character is also a delimiter to ensure that we have "".....""
                 # In that case we ignore this rstring delimiter
-                if next_c and (self.get_char_at(i + 1) or "") == rstring_delimiter:
+                if next_c and (get_char_at(i + 1) or "") == rstring_delimiter:
                     self.log(
                         "While parsing a string, we found a valid starting doubled quote",
                     )
@@ -307,15 +370,15 @@ class JSONParser:
                 else:
                     # Ok this is not a doubled quote, check if this is an empty string or not
                     i = self.skip_whitespaces_at(idx=1, move_main_index=False)
-                    next_c = self.get_char_at(i)
-                    if next_c in self.STRING_DELIMITERS + ["{", "["]:
+                    next_c = get_char_at(i)
+                    if next_c in self.STRING_DELIMITERS_AND_CONTAINERS:
                         # something fishy is going on here
                         self.log(
                             "While parsing a string, we found a doubled quote but also another quote afterwards, ignoring it",
                         )
                         self.index += 1
                         return ""
-                    elif next_c not in [",", "]", "}"]:
+                    elif next_c not in {",", "]", "}"}:
                         self.log(
                             "While parsing a string, we found a doubled quote but it was a mistake, removing one quote",
                         )
@@ -323,7 +386,7 @@ class JSONParser:
             else:
                 # Otherwise we need to do another check before continuing
                 i = self.skip_to_character(character=rstring_delimiter, idx=1)
-                next_c = self.get_char_at(i)
+                next_c = get_char_at(i)
                 if not next_c:
                     # mmmm that delimiter never appears again, this is a mistake
                     self.log(
@@ -332,7 +395,7 @@ class JSONParser:
                     return ""
 
         # Initialize our return value
-        string_acc = ""
+        string_acc: str = ""
 
         # Here things get a bit hairy because a string missing the final quote can also be a key or a value in an object
         # In that case we need to use the ":|,|}" characters as terminators of the string
@@ -340,33 +403,42 @@ class JSONParser:
         # * It finds a closing quote
         # * It iterated over the entire sequence
         # * If we are fixing missing quotes in an object, when it finds the special terminators
-        char = self.get_char_at()
+        char = get_char_at()
         unmatched_delimiter = False
+        # Only a handful of characters can trigger one of the heuristics in the loop below,
+        # the ones in between are copied in bulk instead of going through the loop one at the time
+        stop_pattern = None
+        text = ""
+        if isinstance(self.json_str, str):
+            text = self.json_str
+            stop_pattern = self.get_string_stop_pattern(
+                rstring_delimiter, missing_quotes
+            )
+        # The context can't change while parsing a string, these are checked for every character
+        in_object_key = self.context.current == ContextValues.OBJECT_KEY
+        in_object_value = self.context.current == ContextValues.OBJECT_VALUE
+        in_array = ContextValues.ARRAY in self.context.context
         while char and char != rstring_delimiter:
-            if (
-                missing_quotes
-                and self.context.current == ContextValues.OBJECT_KEY
-                and (char == ":" or char.isspace())
-            ):
+            if missing_quotes and in_object_key and (char == ":" or char.isspace()):
                 self.log(
                     "While parsing a string missing the left delimiter in object key context, we found a :, stopping here",
                 )
                 break
-            if self.context.current == ContextValues.OBJECT_VALUE and char in [
+            if in_object_value and char in {
                 ",",
                 "}",
-            ]:
+            }:
                 rstring_delimiter_missing = True
                 # check if this is a case in which the closing comma is NOT missing instead
                 i = self.skip_to_character(character=rstring_delimiter, idx=1)
-                next_c = self.get_char_at(i)
+                next_c = get_char_at(i)
                 if next_c:
                     i += 1
                     # found a delimiter, now we need to check that is followed strictly by a comma or brace
                     # or the string ended
                     i = self.skip_whitespaces_at(idx=i, move_main_index=False)
-                    next_c = self.get_char_at(i)
-                    if not next_c or next_c in [",", "}"]:
+                    next_c = get_char_at(i)
+                    if not next_c or next_c in {",", "}"}:
                         rstring_delimiter_missing = False
                     else:
                         # OK but this could still be some garbage at the end of the string
@@ -377,7 +449,7 @@ class JSONParser:
                             i = self.skip_to_character(
                                 character=lstring_delimiter, idx=i
                             )
-                        next_c = self.get_char_at(i)
+                        next_c = get_char_at(i)
                         if not next_c:
                             rstring_delimiter_missing = False
                         else:
@@ -386,7 +458,7 @@ class JSONParser:
                             i = self.skip_whitespaces_at(
                                 idx=i + 1, move_main_index=False
                             )
-                            next_c = self.get_char_at(i)
+                            next_c = get_char_at(i)
                             if next_c and next_c != ":":
                                 rstring_delimiter_missing = False
                 else:
@@ -394,7 +466,7 @@ class JSONParser:
                     # because it might be a systemic issue with the output
                     # So let's check if we can find a : in the string instead
                     i = self.skip_to_character(character=":", idx=1)
-                    next_c = self.get_char_at(i)
+                    next_c = get_char_at(i)
                     if next_c:
                         # OK then this is a systemic issue with the output
                         break
@@ -410,7 +482,7 @@ class JSONParser:
                             # Let's ignore
                             rstring_delimiter_missing = False
                         # Check that j was not out of bound
-                        elif self.get_char_at(j):
+                        elif get_char_at(j):
                             # Check for an unmatched opening brace in string_acc
                             for c in reversed(string_acc):
                                 if c == "{":
@@ -424,46 +496,48 @@ class JSONParser:
                         "While parsing a string missing the left delimiter in object value context, we found a , or } and we couldn't determine that a right delimiter was present. Stopping here",
                     )
                     break
-            if char == "]" and ContextValues.ARRAY in self.context.context:
+            if char == "]" and in_array:
                 # We found the end of an array and we are in array context
                 # So let's check if we find a rstring_delimiter forward otherwise end early
                 i = self.skip_to_character(rstring_delimiter)
-                if not self.get_char_at(i):
+                if not get_char_at(i):
                     # No delimiter found
                     break
             string_acc += char
             self.index += 1
-            char = self.get_char_at()
+            char = get_char_at()
             if char and len(string_acc) > 0 and string_acc[-1] == "\\":
                 # This is a special case, if people use real strings this might happen
                 self.log("Found a stray escape sequence, normalizing it")
-                if char in [rstring_delimiter, "t", "n", "r", "b", "\\"]:
+                if char == rstring_delimiter or char in {"t", "n", "r", "b", "\\"}:
                     string_acc = string_acc[:-1]
-                    escape_seqs = {"t": "\t", "n": "\n", "r": "\r", "b": "\b"}
-                    string_acc += escape_seqs.get(char, char) or char
+                    string_acc += ESCAPE_SEQUENCES.get(char, char)
                     self.index += 1
-                    char = self.get_char_at()
+                    char = get_char_at()
+            if stop_pattern and char:
+                match = stop_pattern.search(text, self.index)
+                end = match.start() if match else len(text)
+                if end > self.index:
+                    string_acc += text[self.index : end]
+                    self.index = end
+                    char = get_char_at()
             # If we are in object key context and we find a colon, it could be a missing right quote
-            if (
-                char == ":"
-                and not missing_quotes
-                and self.context.current == ContextValues.OBJECT_KEY
-            ):
+            if char == ":" and not missing_quotes and in_object_key:
                 # Ok now we need to check if this is followed by a value like "..."
                 i = self.skip_to_character(character=lstring_delimiter, idx=1)
-                next_c = self.get_char_at(i)
+                next_c = get_char_at(i)
                 if next_c:
                     i += 1
                     # found the first delimiter
                     i = self.skip_to_character(character=rstring_delimiter, idx=i)
-                    next_c = self.get_char_at(i)
+                    next_c = get_char_at(i)
                     if next_c:
                         # found a second delimiter
                         i += 1
                         # Skip spaces
                         i = self.skip_whitespaces_at(idx=i, move_main_index=False)
-                        next_c = self.get_char_at(i)
-                        if next_c and next_c in [",", "}"]:
+                        next_c = get_char_at(i)
+                        if next_c and next_c in {",", "}"}:
                             # Ok then this is a missing right quote
                             self.log(
                                 "While parsing a string missing the right delimiter in object key context, we found a :, stopping here",
@@ -478,34 +552,31 @@ class JSONParser:
             # ChatGPT sometimes forget to quote stuff in html tags or markdown, so we do this whole thing here
             if char == rstring_delimiter:
                 # Special case here, in case of double quotes one after another
-                if doubled_quotes and self.get_char_at(1) == rstring_delimiter:
+                if doubled_quotes and get_char_at(1) == rstring_delimiter:
                     self.log(
                         "While parsing a string, we found a doubled quote, ignoring it"
                     )
                     self.index += 1
-                elif (
-                    missing_quotes
-                    and self.context.current == ContextValues.OBJECT_VALUE
-                ):
+                elif missing_quotes and in_object_value:
                     # In case of missing starting quote I need to check if the delimeter is the end or the beginning of a key
                     i = 1
-                    next_c = self.get_char_at(i)
+                    next_c = get_char_at(i)
                     while next_c and next_c not in [
                         rstring_delimiter,
                         lstring_delimiter,
                     ]:
                         i += 1
-                        next_c = self.get_char_at(i)
+                        next_c = get_char_at(i)
                     if next_c:
                         # We found a quote, now let's make sure there's a ":" following
                         i += 1
                         # found a delimiter, now we need to check that is followed strictly by a comma or brace
                         i = self.skip_whitespaces_at(idx=i, move_main_index=False)
-                        next_c = self.get_char_at(i)
+                        next_c = get_char_at(i)
                         if next_c and next_c == ":":
                             # Reset the cursor
                             self.index -= 1
-                            char = self.get_char_at()
+                            char = get_char_at()
                             self.log(
                                 "In a string with missing quotes and object value context, I found a delimeter but it turns out it was the beginning on the next key. Stopping here.",
                             )
@@ -514,12 +585,19 @@ class JSONParser:
                     unmatched_delimiter = False
                     string_acc += str(char)
                     self.index += 1
-                    char = self.get_char_at()
+                    char = get_char_at()
                 else:
                     # Check if eventually there is a rstring delimiter, otherwise we bail
                     i = 1
-                    next_c = self.get_char_at(i)
+                    next_c = get_char_at(i)
                     check_comma_in_object_value = True
+                    # Look these up once, not for every character of the lookahead
+                    object_key_in_context = (
+                        ContextValues.OBJECT_KEY in self.context.context
+                    )
+                    object_value_in_context = (
+                        ContextValues.OBJECT_VALUE in self.context.context
+                    )
                     while next_c and next_c not in [
                         rstring_delimiter,
                         lstring_delimiter,
@@ -530,39 +608,27 @@ class JSONParser:
                             check_comma_in_object_value = False
                         # If we are in an object context, let's check for the right delimiters
                         if (
-                            (
-                                ContextValues.OBJECT_KEY in self.context.context
-                                and next_c in [":", "}"]
-                            )
-                            or (
-                                ContextValues.OBJECT_VALUE in self.context.context
-                                and next_c == "}"
-                            )
-                            or (
-                                ContextValues.ARRAY in self.context.context
-                                and next_c in ["]", ","]
-                            )
+                            (object_key_in_context and next_c in {":", "}"})
+                            or (object_value_in_context and next_c == "}")
+                            or (in_array and next_c in {"]", ","})
                             or (
                                 check_comma_in_object_value
-                                and self.context.current == ContextValues.OBJECT_VALUE
+                                and in_object_value
                                 and next_c == ","
                             )
                         ):
                             break
                         i += 1
-                        next_c = self.get_char_at(i)
+                        next_c = get_char_at(i)
                     # If we stopped for a comma in object_value context, let's check if find a "} at the end of the string
-                    if (
-                        next_c == ","
-                        and self.context.current == ContextValues.OBJECT_VALUE
-                    ):
+                    if next_c == "," and in_object_value:
                         i += 1
                         i = self.skip_to_character(character=rstring_delimiter, idx=i)
-                        next_c = self.get_char_at(i)
+                        next_c = get_char_at(i)
                         # Ok now I found a delimiter, let's skip whitespaces and see if next we find a }
                         i += 1
                         i = self.skip_whitespaces_at(idx=i, move_main_index=False)
-                        next_c = self.get_char_at(i)
+                        next_c = get_char_at(i)
                         if next_c == "}":
                             # OK this is valid then
                             self.log(
@@ -571,11 +637,9 @@ class JSONParser:
                             unmatched_delimiter = not unmatched_delimiter
                             string_acc += str(char)
                             self.index += 1
-                            char = self.get_char_at()
-                    elif (
-                        next_c == rstring_delimiter and self.get_char_at(i - 1) != "\\"
-                    ):
-                        if self.context.current == ContextValues.OBJECT_VALUE:
+                            char = get_char_at()
+                    elif next_c == rstring_delimiter and get_char_at(i - 1) != "\\":
+                        if in_object_value:
                             # But this might not be it! This could be just a missing comma
                             # We found a delimiter and we need to check if this is a key
                             # so find a rstring_delimiter and a colon after
@@ -583,15 +647,15 @@ class JSONParser:
                                 character=rstring_delimiter, idx=i + 1
                             )
                             i += 1
-                            next_c = self.get_char_at(i)
+                            next_c = get_char_at(i)
                             while next_c and next_c != ":":
                                 if next_c == "," or (
                                     next_c == rstring_delimiter
-                                    and self.get_char_at(i - 1) != "\\"
+                                    and get_char_at(i - 1) != "\\"
                                 ):
                                     break
                                 i += 1
-                                next_c = self.get_char_at(i)
+                                next_c = get_char_at(i)
                             # Only if we fail to find a ':' then we know this is misplaced quote
                             if next_c != ":":
                                 self.log(
@@ -600,12 +664,12 @@ class JSONParser:
                                 unmatched_delimiter = not unmatched_delimiter
                                 string_acc += str(char)
                                 self.index += 1
-                                char = self.get_char_at()
+                                char = get_char_at()
                         elif self.context.current == ContextValues.ARRAY:
                             # In array context this could be something like "lorem "ipsum" sic"
                             # So let's check if we find a rstring_delimiter forward otherwise end early
                             i = self.skip_to_character(rstring_delimiter, idx=i + 1)
-                            next_c = self.get_char_at(i)
+                            next_c = get_char_at(i)
                             if next_c and next_c == rstring_delimiter:
                                 # Ok now if I find a comma or a closing ], that can be have also an optional rstring_delimiter before them
                                 # We can consider this a misplaced quote
@@ -613,27 +677,22 @@ class JSONParser:
                                 i = self.skip_whitespaces_at(
                                     idx=i, move_main_index=False
                                 )
-                                next_c = self.get_char_at(i)
-                                if next_c and next_c in [",", "]"]:
+                                next_c = get_char_at(i)
+                                if next_c and next_c in {",", "]"}:
                                     self.log(
                                         "While parsing a string, we a misplaced quote that would have closed the string but has a different meaning here, ignoring it",
                                     )
                                     unmatched_delimiter = not unmatched_delimiter
                                     string_acc += str(char)
                                     self.index += 1
-                                    char = self.get_char_at()
-
-        if (
-            char
-            and missing_quotes
-            and self.context.current == ContextValues.OBJECT_KEY
-            and char.isspace()
-        ):
+                                    char = get_char_at()
+
+        if char and missing_quotes and in_object_key and char.isspace():
             self.log(
                 "While parsing a string, handling an extreme corner case in which the LLM added a comment instead of valid string, invalidate the string and return an empty value",
             )
             self.skip_whitespaces_at()
-            if self.get_char_at() not in [":", ","]:
+            if get_char_at() not in {":", ","}:
                 return ""
 
         # A fallout of the previous special case in the while loop,
@@ -647,16 +706,16 @@ class JSONParser:
 
         return string_acc.rstrip()
 
-    def parse_number(self) -> Union[float, int, str, JSONReturnType]:
+    def parse_number(self) -> Union[float, int, str]:
         # <number> is a valid real number expressed in one of a number of given formats
-        number_str = ""
-        number_chars = set("0123456789-.eE/,")
-        char = self.get_char_at()
-        is_array = self.context.current == ContextValues.ARRAY
-        while char and char in number_chars and (char != "," or not is_array):
-            number_str += char
-            self.index += 1
-            char = self.get_char_at()
+        # In an array the comma is a separator and can't be part of the number
+        if self.context.current == ContextValues.ARRAY:
+            pattern = ARRAY_NUMBER_PATTERN
+        else:
+            pattern = NUMBER_PATTERN
+        end = self.match_end(pattern, self.index)
+        number_str = self.json_str[self.index : end]
+        self.index = end
         if len(number_str) > 1 and number_str[-1] in "-eE/,":
             # The number ends with a non valid character for a number/currency, rolling back one
             number_str = number_str[:-1]
@@ -666,39 +725,66 @@ class JSONParser:
                 return str(number_str)
             if "." in number_str or "e" in number_str or "E" in number_str:
                 return float(number_str)
-            elif number_str == "-":
-                # If there is a stray "-" this will throw an exception, throw away this character
-                return self.parse_json()
             else:
+                # A stray "-" never gets here, parse_json skips it beforehand
                 return int(number_str)
         except ValueError:
             return number_str
 
+    def is_stray_minus(self) -> bool:
+        """
+        True if parse_number, called on the "-" at the current index, would find nothing but that "-".
+        """
+        number_chars = (
+            ARRAY_NUMBER_CHARS
+            if self.context.current == ContextValues.ARRAY
+            else NUMBER_CHARS
+        )
+        next_c = self.get_char_at(1)
+        if next_c not in number_chars:
+            return True
+        # parse_number rolls back a trailing "-eE/," so "-e" alone is stray too
+        return next_c in "-eE/," and self.get_char_at(2) not in number_chars
+
     def parse_boolean_or_null(self) -> Union[bool, str, None]:
         # <boolean> is one of the literal strings 'true', 'false', or 'null' (unquoted)
-        starting_index = self.index
-        char = (self.get_char_at() or "").lower()
-        value: Optional[Tuple[str, Optional[bool]]]
-        if char == "t":
-            value = ("true", True)
-        elif char == "f":
-            value = ("false", False)
-        elif char == "n":
-            value = ("null", None)
-
+        value = LITERALS.get((self.get_char_at() or "").lower())
         if value:
-            i = 0
-            while char and i < len(value[0]) and char == value[0][i]:
-                i += 1
-                self.index += 1
-                char = (self.get_char_at() or "").lower()
-            if i == len(value[0]):
+            # Compare the whole literal at once instead of character by character
+            length = len(value[0])
+            if self.json_str[self.index : self.index + length].lower() == value[0]:
+                self.index += length
                 return value[1]
 
-        # If nothing works reset the index before returning
-        self.index = starting_index
+        # If nothing works the index was never moved
         return ""
 
+    def get_string_stop_pattern(
+        self, rstring_delimiter: str, missing_quotes: bool
+    ) -> re.Pattern[str]:
+        """
+        Build (or get from the cache) the pattern matching the characters that parse_string can't copy blindly in the current context
+        """
+        stop_chars = rstring_delimiter + "\\"
+        if self.context.current == ContextValues.OBJECT_KEY:
+            stop_chars += ":"
+        elif self.context.current == ContextValues.OBJECT_VALUE:
+            stop_chars += ",}"
+        if ContextValues.ARRAY in self.context.context:
+            stop_chars += "]"
+        stop_on_whitespace = (
+            missing_quotes and self.context.current == ContextValues.OBJECT_KEY
+        )
+        try:
+            return STRING_STOP_PATTERNS[stop_chars, stop_on_whitespace]
+        except KeyError:
+            pattern = "[" + re.escape(stop_chars)
+            if stop_on_whitespace:
+                pattern += "\\s"
+            pattern += "]"
+            STRING_STOP_PATTERNS[stop_chars, stop_on_whitespace] = re.compile(pattern)
+            return STRING_STOP_PATTERNS[stop_chars, stop_on_whitespace]
+
     def get_char_at(self, count: int = 0) -> Union[str, Literal[False]]:
         # Why not use something simpler? Because try/except in python is a faster alternative to an "if" statement that is often True
         try:
@@ -706,7 +792,7 @@ class JSONParser:
         except IndexError:
             return False
 
-    def skip_whitespaces_at(self, idx: int = 0, move_main_index=True) -> int:
+    def skip_whitespaces_at(self, idx: int = 0, move_main_index: bool = True) -> int:
         """
         This function quickly iterates on whitespaces, syntactic sugar to make the code more concise
         """
@@ -714,21 +800,42 @@ class JSONParser:
             char = self.json_str[self.index + idx]
         except IndexError:
             return idx
-        while char.isspace():
-            if move_main_index:
-                self.index += 1
-            else:
-                idx += 1
-            try:
-                char = self.json_str[self.index + idx]
-            except IndexError:
-                return idx
+        if not char.isspace():
+            return idx
+        # Let the regex engine find the end of the run of whitespaces in one call
+        end = self.match_end(WHITESPACES_PATTERN, self.index + idx + 1)
+        if move_main_index:
+            self.index = end - idx
+        else:
+            idx = end - self.index
         return idx
 
+    def match_end(self, pattern: re.Pattern[str], index: int) -> int:
+        """
+        Find where a match of a pattern that can't fail (like r"\\s*") starting at index ends, for strings and files alike
+        """
+        if isinstance(self.json_str, str):
+            match = pattern.match(self.json_str, index)
+            return match.end() if match else index
+        return self.json_str.match_end(pattern, index)
+
     def skip_to_character(self, character: str, idx: int = 0) -> int:
         """
         This function quickly iterates to find a character, syntactic sugar to make the code more concise
         """
+        if isinstance(self.json_str, str) and self.index + idx >= 0:
+            # Let str.find do the scanning, only the escaped matches are looked at in python
+            start = self.index + idx
+            if start >= len(self.json_str):
+                return idx
+            while True:
+                end = self.json_str.find(character, start)
+                if end == -1:
+                    return len(self.json_str) - self.index
+                if end == 0 or self.json_str[end - 1] != "\\":
+                    return end - self.index
+                # Ah this is an escaped character, try again
+                start = end + 1
         try:
             char = self.json_str[self.index + idx]
         except IndexError:
@@ -25,10 +25,31 @@ All supported use cases are in the unit tests
 import argparse
 import json
 import sys
-from typing import Dict, List, Optional, TextIO, Tuple, Union
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple, Union
 
 from .json_parser import JSONParser, JSONReturnType
 
+# How many characters the CLI collects before writing them to stdout
+_OUTPUT_BATCH_SIZE = 64 * 1024
+
+# Every valid JSON document starts with one of these characters (NaN and Infinity included)
+_JSON_FIRST_CHARS = frozenset('{["-0123456789tfnNI')
+
+
+def _can_be_valid_json(json_str: str) -> bool:
+    """
+    Cheap check on the first non whitespace character to know if json.loads() has any chance of succeeding.
+    LLMs often wrap the JSON in prose or markdown, in that case there is no point in trying json.loads().
+
+    Args:
+        json_str (str): The (beginning of the) JSON string to check.
+
+    Returns:
+        bool: False if json.loads() is guaranteed to fail on this string.
+    """
+    first = next((c for c in json_str if not c.isspace()), "")
+    return first in _JSON_FIRST_CHARS
+
 
 def repair_json(
     json_str: str = "",
@@ -54,9 +75,31 @@ def repair_json(
     Returns:
         Union[JSONReturnType, Tuple[JSONReturnType, List[Dict[str, str]]]]: The repaired JSON or a tuple with the repaired JSON and repair log.
     """
-    parser = JSONParser(json_str, json_fd, logging, chunk_length)
+    if not json_fd and (not json_str or json_str.isspace()):
+        # Blank input always repairs to an empty string, don't build anything for it
+        if logging:
+            return "", []
+        return "" if return_objects else '""'
+    if not skip_json_loads:
+        # Don't waste time on json.loads() if the input can't be a valid JSON in the first place
+        if json_fd:
+            # We can only peek if we can go back: pipes can't, and json.load() also takes objects that only have read()
+            seekable = getattr(json_fd, "seekable", None)
+            if callable(seekable) and seekable():
+                position = json_fd.tell()
+                # The peek must get past any leading whitespaces
+                head = json_fd.read(64)
+                while head.isspace():
+                    head = json_fd.read(64)
+                json_fd.seek(position)
+                # Files opened in binary mode give bytes, leave those to json.load()
+                if isinstance(head, str):
+                    skip_json_loads = not _can_be_valid_json(head)
+        elif isinstance(json_str, str):
+            # Same for bytes and bytearray, json.loads() accepts them
+            skip_json_loads = not _can_be_valid_json(json_str)
     if skip_json_loads:
-        parsed_json = parser.parse()
+        parsed_json = JSONParser(json_str, json_fd, logging, chunk_length).parse()
     else:
         try:
             if json_fd:
@@ -64,7 +107,11 @@ def repair_json(
             else:
                 parsed_json = json.loads(json_str)
         except json.JSONDecodeError:
-            parsed_json = parser.parse()
+            # Only build the parser when there is something to repair
+            parsed_json = JSONParser(json_str, json_fd, logging, chunk_length).parse()
+        else:
+            if logging:
+                parsed_json = parsed_json, []
     # It's useful to return the actual object instead of the json string,
     # it allows this lib to be a replacement of the json library
     if return_objects or logging:
@@ -97,6 +144,34 @@ def loads(
     )
 
 
+def loads_many(
+    json_strs: Iterable[str],
+    skip_json_loads: bool = False,
+    logging: bool = False,
+) -> List[Union[JSONReturnType, Tuple[JSONReturnType, List[Dict[str, str]]]]]:
+    """
+    This function works like `loads()` but on a batch of JSON strings, for example the outputs of a batched LLM inference.
+    The results are returned in the same order as the input.
+
+    Args:
+        json_strs (Iterable[str]): The JSON strings to load and repair.
+        skip_json_loads (bool, optional): If True, skip calling the built-in json.loads() function to verify that the json is valid before attempting to repair. Defaults to False.
+        logging (bool, optional): If True, every element of the result is a tuple with the repaired json and a log of all repair actions. Defaults to False.
+
+    Returns:
+        List[Union[JSONReturnType, Tuple[JSONReturnType, List[Dict[str, str]]]]]: The repaired JSON objects (or tuples with the repaired JSON object and repair log), in input order.
+    """
+    return [
+        repair_json(
+            json_str=json_str,
+            return_objects=True,
+            skip_json_loads=skip_json_loads,
+            logging=logging,
+        )
+        for json_str in json_strs
+    ]
+
+
 def load(
     fd: TextIO,
     skip_json_loads: bool = False,
@@ -160,7 +235,7 @@ def cli(inline_args: Optional[List[str]] = None) -> int:
 
     Args:
         inline_args (Optional[List[str]]): List of command-line arguments for testing purposes. Defaults to None.
-            - filename (str): The JSON file to repair
+            - filename (str): The JSON file to repair (if omitted, reads from stdin)
             - -i, --inline (bool): Replace the file inline instead of returning the output to stdout.
             - -o, --output TARGET (str): If specified, the output will be written to TARGET filename instead of stdout.
             - --ensure_ascii (bool): Pass ensure_ascii=True to json.dumps(). Will pass False otherwise.
@@ -176,7 +251,11 @@ def cli(inline_args: Optional[List[str]] = None) -> int:
         >>> cli(['example.json', '--indent', '4'])
     """
     parser = argparse.ArgumentParser(description="Repair and parse JSON files.")
-    parser.add_argument("filename", help="The JSON file to repair")
+    parser.add_argument(
+        "filename",
+        nargs="?",
+        help="The JSON file to repair (if omitted, reads from stdin)",
+    )
     parser.add_argument(
         "-i",
         "--inline",
@@ -212,18 +291,40 @@ def cli(inline_args: Optional[List[str]] = None) -> int:
         print("Error: You cannot pass both --inline and --output", file=sys.stderr)
         sys.exit(1)
 
+    if args.inline and not args.filename:
+        print("Error: Inline mode requires a filename", file=sys.stderr)
+        sys.exit(1)
+
     ensure_ascii = False
     if args.ensure_ascii:
         ensure_ascii = True
 
     try:
-        result = from_file(args.filename)
+        if args.filename:
+            result = from_file(args.filename)
+        else:
+            # Read the raw bytes and decode them in one go, this skips the text layer newline translation
+            data = sys.stdin.buffer.read().decode("utf-8", errors="surrogatepass")
+            result = loads(data)
 
         if args.inline or args.output:
             with open(args.output or args.filename, mode="w") as fd:
                 json.dump(result, fd, indent=args.indent, ensure_ascii=ensure_ascii)
         else:
-            print(json.dumps(result, indent=args.indent, ensure_ascii=ensure_ascii))
+            # Stream the output instead of building the whole serialized string in memory,
+            # json.dump() would write every single token so the pieces are written in ~64KB batches
+            encoder = json.JSONEncoder(indent=args.indent, ensure_ascii=ensure_ascii)
+            batch: List[str] = []
+            batch_size = 0
+            for piece in encoder.iterencode(result):
+                batch.append(piece)
+                batch_size += len(piece)
+                if batch_size >= _OUTPUT_BATCH_SIZE:
+                    sys.stdout.write("".join(batch))
+                    batch = []
+                    batch_size = 0
+            batch.append("\n")
+            sys.stdout.write("".join(batch))
     except Exception as e:  # pragma: no cover
         print(f"Error: {str(e)}", file=sys.stderr)
         return 1
@@ -1,4 +1,5 @@
 import os
+import re
 from typing import TextIO, Union
 
 
@@ -38,15 +39,17 @@ class StringFileWrapper:
         Returns:
             str: The buffer chunk at the specified index.
         """
-        if self.buffers.get(index) is None:
+        # This is called for every character, so look the buffer up only once when it's already loaded
+        buffer = self.buffers.get(index)
+        if buffer is None:
             self.fd.seek(index * self.buffer_length)
-            self.buffers[index] = self.fd.read(self.buffer_length)
+            buffer = self.buffers[index] = self.fd.read(self.buffer_length)
             # Save memory by keeping max 2MB buffer chunks and min 2 chunks
             if len(self.buffers) > max(2, 2_000_000 / self.buffer_length):
                 oldest_key = next(iter(self.buffers))
                 if oldest_key != index:
                     self.buffers.pop(oldest_key)
-        return self.buffers[index]
+        return buffer
 
     def __getitem__(self, index: Union[int, slice]) -> str:
         """
@@ -83,6 +86,29 @@ class StringFileWrapper:
             buffer_index = index // self.buffer_length
             return self.get_buffer(buffer_index)[index % self.buffer_length]
 
+    def match_end(self, pattern: re.Pattern[str], index: int) -> int:
+        """
+        Find where the run of characters matched by the pattern starting at index ends, chunk by chunk.
+
+        Args:
+            pattern (re.Pattern[str]): A single repeated character class like r"\\s*", so that matching can carry on in the next chunk.
+            index (int): Where the run starts.
+
+        Returns:
+            int: The index of the first character after the run.
+        """
+        buffer_index = index // self.buffer_length
+        offset = index % self.buffer_length
+        while True:
+            buffer = self.get_buffer(buffer_index)
+            match = pattern.match(buffer, offset)
+            end = match.end() if match else offset
+            # Stop if the run ended inside this chunk or this is the last chunk
+            if end < len(buffer) or len(buffer) < self.buffer_length:
+                return buffer_index * self.buffer_length + end
+            buffer_index += 1
+            offset = 0
+
     def __len__(self) -> int:
         """
         Get the total length of the file.
@@ -1,7 +1,9 @@
-from src.json_repair.json_repair import from_file, repair_json, loads, cli
+from src.json_repair.json_repair import from_file, repair_json, load, loads, loads_many, cli, _can_be_valid_json
 from unittest.mock import patch
+import io
 import os.path
 import pathlib
+import pytest
 import tempfile
 
 def test_basic_types_valid():
@@ -117,6 +119,7 @@ def test_array_edge_cases():
     assert repair_json("[1, 2, '...', 3]") == '[1, 2, "...", 3]'
     assert repair_json("[true, false, null, ...]") == '[true, false, null]'
     assert repair_json('["a" "b" "c" 1') == '["a", "b", "c", 1]'
+    assert repair_json('["a" "') == '["a"]'
     assert repair_json('{"employees":["John", "Anna",') == '{"employees": ["John", "Anna"]}'
     assert repair_json('{"employees":["John", "Anna", "Peter') == '{"employees": ["John", "Anna", "Peter"]}'
     assert repair_json('{"key1": {"key2": [1, 2, 3') == '{"key1": {"key2": [1, 2, 3]}}'
@@ -129,6 +132,7 @@ def test_escaping():
     assert repair_json(r'{"real_content": "Some string: Some other string \t Some string <a href=\"https://domain.com\">Some link</a>"') == r'{"real_content": "Some string: Some other string \t Some string <a href=\"https://domain.com\">Some link</a>"}'
     assert repair_json('{"key_1\n": "value"}') == '{"key_1": "value"}'
     assert repair_json('{"key\t_": "value"}') == '{"key\\t_": "value"}'
+    assert repair_json('{"name": "#John", \\"age": 30, "city": "New') == '{"name": "#John", "age": 30, "city": "New"}'
     
     
 def test_object_edge_cases():
@@ -156,6 +160,7 @@ def test_object_edge_cases():
     assert repair_json('{"key:"value"}') == '{"key": "value"}'
     assert repair_json('{"key:value}') == '{"key": "value"}'
     assert repair_json('[{"lorem": {"ipsum": "sic"}, """" "lorem": {"ipsum": "sic"}]') == '[{"lorem": {"ipsum": "sic"}}, {"lorem": {"ipsum": "sic"}}]'
+    assert repair_json('[{"a": {"b": 1, "b": 2}}', skip_json_loads=True) == '[{"a": {"b": 1}, "b": 2}]'
 
 def test_number_edge_cases():
     assert repair_json(' - { "test_key": ["test_value", "test_value2"] }') == '{"test_key": ["test_value", "test_value2"]}'
@@ -169,6 +174,7 @@ def test_number_edge_cases():
     assert repair_json('{"key": 10-20}') == '{"key": "10-20"}'
     assert repair_json('{"key": 1.1.1}') == '{"key": "1.1.1"}'
     assert repair_json('[- ') == '[]'
+    assert repair_json('{"key": ' + '- ' * 2000 + '1}') == '{"key": 1}'
 
 def test_markdown():
     assert repair_json('{ "content": "[LINK]("https://google.com")" }') == '{"content": "[LINK](\\"https://google.com\\")"}'
@@ -184,11 +190,24 @@ def test_leading_trailing_characters():
                        ```json
                        { "key": "value" }
                        ```""") == '{"key": "value"}'
+
+def test__can_be_valid_json():
+    assert _can_be_valid_json('  {"key": "value"}')
+    assert _can_be_valid_json("\n[1, 2]")
+    assert _can_be_valid_json("-1.5")
+    assert _can_be_valid_json("NaN")
+    assert not _can_be_valid_json("```json {}```")
+    assert not _can_be_valid_json("Here is your JSON: {}")
+    assert not _can_be_valid_json("   ")
+
 def test_multiple_jsons():
     assert repair_json("[]{}") == "[[], {}]"
     assert repair_json("{}[]{}") == "[{}, [], {}]"
     assert repair_json('{"key":"value"}[1,2,3,True]') == '[{"key": "value"}, [1, 2, 3, true]]'
     assert repair_json('lorem ```json {"key":"value"} ``` ipsum ```json [1,2,3,True] ``` 42') == '[{"key": "value"}, [1, 2, 3, true]]'
+    # An object closed on a duplicate key right before the end of an array, the rest is the next json
+    assert repair_json('[{a"}}{a:1a', skip_json_loads=True) == '[[{}], {"a": 1}, {}]'
+    assert repair_json('* [{"a": 9{"a": 1, "a": 2}]\tl/\t{"a": 2[/{"a": 1, "a": 2}', skip_json_loads=True) == '[[{"a": 9}, {"a": 1}, {"a": 2}], {"a": 2}, {"a": 1}, {"a": 2}]'
 
 def test_repair_json_with_objects():
     # Test with valid JSON strings
@@ -237,11 +256,27 @@ def test_repair_json_with_objects():
         ]
         """, return_objects=True) == [{"foo": "Foo bar baz", "tag": "#foo-bar-baz"},{"foo": "foo bar \"foobar\" foo bar baz.", "tag": "#foo-bar-foobar" }]
 
+def test_repair_json_bytes():
+    # json.loads() accepts bytes and bytearray, so valid ones go through as before
+    assert repair_json(b'{"a": 1}') == '{"a": 1}'
+    assert repair_json(bytearray(b'[1]'), return_objects=True) == [1]
+
 def test_repair_json_skip_json_loads():
     assert repair_json('{"key": true, "key2": false, "key3": null}', skip_json_loads=True) == '{"key": true, "key2": false, "key3": null}'
     assert repair_json('{"key": true, "key2": false, "key3": null}', return_objects=True, skip_json_loads=True) == {"key": True, "key2": False, "key3": None}
     assert repair_json('{"key": true, "key2": false, "key3": }', skip_json_loads=True) == '{"key": true, "key2": false, "key3": ""}'
     assert loads('{"key": true, "key2": false, "key3": }', skip_json_loads=True) == {"key": True, "key2": False, "key3": ""}
+    assert loads('{"key": true, "key2": false, "key3": null}', logging=True) == ({"key": True, "key2": False, "key3": None}, [])
+    # Every call gets its own log
+    loads("[]", logging=True)[1].append({"text": "mine", "context": ""})
+    assert loads("[]", logging=True) == ([], [])
+    assert loads(" \n", skip_json_loads=True, logging=True) == ("", [])
+
+def test_loads_many():
+    assert loads_many(['{"key": "value"}', "{'key': 'value'", "[1, 2"]) == [{"key": "value"}, {"key": "value"}, [1, 2]]
+    assert loads_many(iter(["[1, 2"]), skip_json_loads=True) == [[1, 2]]
+    assert loads_many([]) == []
+    assert loads_many(["[1, 2"], logging=True) == [([1, 2], [])]
 
 
 def test_repair_json_from_file():
@@ -276,6 +311,64 @@ def test_repair_json_from_file():
         # Clean up - delete the temporary file
         os.remove(temp_path)
 
+    # Create a temporary file
+    temp_fd, temp_path = tempfile.mkstemp(suffix=".json")
+    try:
+        # Write content to the temporary file
+        with os.fdopen(temp_fd, 'w') as tmp:
+            tmp.write('[{"lorem": {"ipsum": "sic"}, """" "lorem": {"ipsum": "sic"}]')
+        assert from_file(filename=temp_path) == [{"lorem": {"ipsum": "sic"}}, {"lorem": {"ipsum": "sic"}}]
+        assert from_file(filename=temp_path, chunk_length=2) == [{"lorem": {"ipsum": "sic"}}, {"lorem": {"ipsum": "sic"}}]
+    finally:
+        # Clean up - delete the temporary file
+        os.remove(temp_path)
+
+    # Create a temporary file
+    temp_fd, temp_path = tempfile.mkstemp(suffix=".json")
+    try:
+        # Write content to the temporary file
+        with os.fdopen(temp_fd, 'w') as tmp:
+            tmp.write('{"name": "#John", \\"age": 30, "city": "New')
+        assert from_file(filename=temp_path, chunk_length=4) == {"name": "#John", "age": 30, "city": "New"}
+        with open(temp_path, 'w') as tmp:
+            tmp.write('["lorem "ipsum sic]')
+        assert from_file(filename=temp_path, chunk_length=4) == ["lorem", "ipsum sic"]
+    finally:
+        # Clean up - delete the temporary file
+        os.remove(temp_path)
+
+    # Create a temporary file
+    temp_fd, temp_path = tempfile.mkstemp(suffix=".json")
+    try:
+        # A valid JSON with more leading whitespaces than the peek before json.load() reads at once
+        with os.fdopen(temp_fd, 'w') as tmp:
+            tmp.write(' ' * 100 + '{"a": "caf\\u00e9", "b": "\\n"}')
+        assert from_file(filename=temp_path) == {"a": "café", "b": "\n"}
+    finally:
+        # Clean up - delete the temporary file
+        os.remove(temp_path)
+
+    # Pipes can't seek, there is no peeking before json.load() on those
+    class NonSeekableIO(io.StringIO):
+        def seekable(self):
+            return False
+
+        def tell(self):
+            raise io.UnsupportedOperation("underlying stream is not seekable")
+
+    assert load(NonSeekableIO('{"a": 1}')) == {"a": 1}
+
+    # json.load() also takes objects that only have read(), and binary files
+    class ReadOnly:
+        def __init__(self, text):
+            self.text = text
+
+        def read(self, *args):
+            return self.text
+
+    assert load(ReadOnly('{"a": 1}')) == {"a": 1}
+    assert load(io.BytesIO(b'{"a": 1}')) == {"a": 1}
+
 
 def test_ensure_ascii():
     assert repair_json("{'test_中国人_ascii':'统一码'}", ensure_ascii=False) == '{"test_中国人_ascii": "统一码"}'
@@ -312,6 +405,27 @@ def test_cli(capsys):
         os.remove(temp_path)
         os.remove(tempout_path)
 
+
+def test_cli_stdin(capsys):
+    stdin = io.TextIOWrapper(io.BytesIO(b"{key:value"))
+    with patch("sys.stdin", stdin):
+        cli(inline_args=['--indent', 0])
+    captured = capsys.readouterr()
+    assert captured.out == '{\n"key": "value"\n}\n'
+
+    # Bigger outputs are written in batches
+    stdin = io.TextIOWrapper(io.BytesIO(b"[" + b'"lorem ipsum", ' * 20000 + b"1"))
+    with patch("sys.stdin", stdin):
+        cli(inline_args=['--indent', 0])
+    captured = capsys.readouterr()
+    assert captured.out == '[\n' + '"lorem ipsum",\n' * 20000 + '1\n]\n'
+
+def test_cli_inline_without_filename(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        cli(inline_args=['-i'])
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().err == "Error: Inline mode requires a filename\n"
+
 """
 def test_cli_inline(sample_json_file):
     with patch('sys.argv', ['json_repair', sample_json_file, '-i']):